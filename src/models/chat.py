@@ -13,7 +13,7 @@ from __future__ import annotations
 import json
 import time
 from collections.abc import AsyncIterator, Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any, Literal, cast
 
 from ..agents.agent_v1 import AgentV1OutputSchema as AgentOutputSchema
@@ -32,6 +32,7 @@ from ..util.types import (
     ChatCompletionMessage,
     ChatCompletionMessageParam,
     ChatCompletionSwordParam,
+    ChatCompletionUsage,
     InputItem,
     Response,
     ResponseEvent,
@@ -48,11 +49,12 @@ from .settings import ModelSettings
 ########################################################
 
 
-@dataclass
+@dataclass(slots=True)
 class _StreamingState:
     """Maintains the current state of streaming responses."""
 
     text_content_index_and_output: tuple[int, ResponseOutputText] | None = None
+    usage: ChatCompletionUsage | None = None
 
 
 ########################################################
@@ -141,8 +143,13 @@ class ModelChatCompletionsModel(Model):
         state = _StreamingState()
         async for chunk in stream:
             try:
-                delta = chunk.get("choices", [{}])[0].get("delta", {})
-                if delta.get("content"):
+                # Usage is a running snapshot rather than a per-chunk delta, so keep the latest
+                if chunk_usage := chunk.get("usage"):
+                    state.usage = chunk_usage
+
+                choices = chunk.get("choices")
+                delta = choices[0].get("delta") if choices else None
+                if delta and delta.get("content"):
                     if not state.text_content_index_and_output:
                         state.text_content_index_and_output = (
                             0,
@@ -181,6 +188,17 @@ class ModelChatCompletionsModel(Model):
                 part=state.text_content_index_and_output[1],
             )
 
+        if isinstance(response, Response) and state.usage and state.usage.get("total_tokens"):
+            response = replace(
+                response,
+                usage=Usage(
+                    requests=1,
+                    input_tokens=state.usage.get("prompt_tokens", 0),
+                    output_tokens=state.usage.get("completion_tokens", 0),
+                    total_tokens=state.usage["total_tokens"],
+                ),
+            )
+
         yield ResponseEvent(type="completed", response=response)
 
     async def _fetch_response(
@@ -16,6 +16,8 @@ Key features:
 
 from __future__ import annotations
 
+import asyncio
+
 from src.network.client import DeepSeekClient
 from src.network.http import DefaultAsyncHttpxClient
 from src.util.constants import config
@@ -25,6 +27,29 @@ from .chat import ModelChatCompletionsModel
 from .interface import Model
 from .interface import ModelProvider as BaseModelProvider
 from .responses import ModelResponsesModel
+from .shared import get_default_model_key
+
+########################################################
+#               Shared HTTP Client
+########################################################
+
+# httpx pools keep connections bound to the event loop that opened them, so
+# providers share one client per running loop. Only the latest pair is kept:
+# pooled connections reference their loop, so a per-loop map would never let go.
+_shared_httpx: tuple[asyncio.AbstractEventLoop, DefaultAsyncHttpxClient] | None = None
+
+
+def _get_shared_httpx() -> DefaultAsyncHttpxClient:
+    """Return the HTTP client shared by providers on the running loop, or a fresh one."""
+    global _shared_httpx
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return DefaultAsyncHttpxClient()
+    if _shared_httpx is None or _shared_httpx[0] is not loop:
+        _shared_httpx = (loop, DefaultAsyncHttpxClient())
+    return _shared_httpx[1]
+
 
 ########################################################
 #               Main Class: Model Provider
@@ -45,7 +70,11 @@ class ModelProvider(BaseModelProvider):
         self._stored_organization = organization
         self._stored_project = project
         self._use_responses = use_responses
+        self._model_cls: type[ModelChatCompletionsModel] | type[ModelResponsesModel] = (
+            self._resolve_model_cls(use_responses)
+        )
         self._client: AsyncDeepSeek | None = None
+        self._model_cache: dict[str, Model] = {}
 
     @property
     def use_responses(self) -> bool:
@@ -54,24 +83,38 @@ class ModelProvider(BaseModelProvider):
     @use_responses.setter
     def use_responses(self, value: bool) -> None:
         self._use_responses = value
+        self._model_cls = self._resolve_model_cls(value)
+        self._model_cache.clear()
+
+    @staticmethod
+    def _resolve_model_cls(
+        use_responses: bool,
+    ) -> type[ModelChatCompletionsModel] | type[ModelResponsesModel]:
+        return ModelResponsesModel if use_responses else ModelChatCompletionsModel
 
     def _get_client(self) -> AsyncDeepSeek:
         """Lazy load the client to avoid API key errors if never used."""
-        if self._client is None:
-            self._client = DeepSeekClient(
-                api_key=self._stored_api_key,
-                base_url=self._stored_base_url,
-                organization=self._stored_organization,
-                project=self._stored_project,
-                http_client=DefaultAsyncHttpxClient(),
-            )
+        if self._client is not None:
+            return self._client
+
+        if self._stored_api_key is None:
+            self._stored_api_key = get_default_model_key()
+        self._client = DeepSeekClient(
+            api_key=self._stored_api_key,
+            base_url=self._stored_base_url,
+            organization=self._stored_organization,
+            project=self._stored_project,
+            http_client=_get_shared_httpx(),
+        )
         return self._client
 
     def get_model(self, model_name: str | None = None) -> Model:
         """Get a model instance based on name and response type."""
         model_name = model_name or config.MODEL
-        client = self._get_client()
+        if (model := self._model_cache.get(model_name)) is None:
+            model = self._model_cache[model_name] = self._build_model(model_name)
+        return model
 
-        if self._use_responses:
-            return ModelResponsesModel(model=model_name, model_client=client)
-        return ModelChatCompletionsModel(model=model_name, model_client=client)
+    def _build_model(self, model_name: str) -> Model:
+        """Create a model instance for the given name and response type."""
+        return self._model_cls(model=model_name, model_client=self._get_client())
@@ -29,8 +29,6 @@ from typing import (
     cast,
 )
 
-from pydantic import BaseModel
-
 from ..util.types import (
     FunctionCallOutput,
     ResponseFunctionSwordCall,
@@ -58,6 +56,12 @@ REFUSAL_TYPE = "refusal"
 THINK_START = "<think>"
 THINK_END = "</think>"
 
+# Field holding the text for each content type that extract_last_content understands
+CONTENT_TEXT_FIELDS: dict[str, str] = {
+    OUTPUT_TEXT_TYPE: "text",
+    REFUSAL_TYPE: "refusal",
+}
+
 RunItem = Union[
     "MessageOutputItem",
     "OrbsCallItem",
@@ -81,7 +85,8 @@ class RunItemBase(Generic[T], abc.ABC):
     def input_item(self) -> ResponseInputItemParam:
         if isinstance(self.raw_item, dict):
             return self.raw_item
-        elif isinstance(self.raw_item, BaseModel):
+        # Duck-type pydantic models so importing this module does not import pydantic
+        elif hasattr(self.raw_item, "model_dump"):
             return self.raw_item.model_dump(exclude_unset=True)
         return self.raw_item
 
@@ -101,17 +106,16 @@ class MessageOutputItem(RunItemBase[TResponseOutputItem]):
             if not content:
                 return ""
 
+            # Classify each item once instead of re-probing dict vs attribute access per field
             texts = []
             for item in content:
-                if isinstance(item, dict):
-                    if item.get("type") == OUTPUT_TEXT_TYPE:
-                        text = item.get("text", "").strip()
-                        if text:
-                            texts.append(text)
-                elif hasattr(item, "type") and item.type == OUTPUT_TEXT_TYPE:
-                    text = getattr(item, "text", "").strip()
-                    if text:
-                        texts.append(text)
+                is_dict = isinstance(item, dict)
+                item_type = item.get("type") if is_dict else getattr(item, "type", None)
+                if item_type != OUTPUT_TEXT_TYPE:
+                    continue
+                text = (item.get("text", "") if is_dict else getattr(item, "text", "")).strip()
+                if text:
+                    texts.append(text)
 
             return " ".join(texts)
 
@@ -161,18 +165,21 @@ class ModelResponse:
 
     @cached_property
     def input_items(self) -> list[ResponseInputItemParam]:
-        return [
-            cast(
-                ResponseInputItemParam,
-                it.model_dump(exclude_unset=True) if hasattr(it, "model_dump") else it,
-            )
-            for it in self.output
-        ]
+        return [_to_input_item(it) for it in self.output]
 
     def to_input_items(self) -> list[ResponseInputItemParam]:
         return self.input_items
 
 
+def _to_input_item(item: TResponseOutputItem) -> ResponseInputItemParam:
+    # Outputs are usually plain dicts already, so skip the model_dump probe for them
+    if type(item) is dict:
+        return cast(ResponseInputItemParam, item)
+    if hasattr(item, "model_dump"):
+        return item.model_dump(exclude_unset=True)
+    return cast(ResponseInputItemParam, item)
+
+
 class ItemHelpers:
     SPECIAL_LINES: ClassVar[tuple[str]] = (THINK_START, THINK_END)
 
@@ -199,21 +206,18 @@ class ItemHelpers:
                 if isinstance(last_content, dict)
                 else getattr(last_content, "type", None)
             )
+            if content_type is None:
+                return ""
 
-            if content_type == OUTPUT_TEXT_TYPE:
-                return (
-                    last_content.get("text", "")
-                    if isinstance(last_content, dict)
-                    else getattr(last_content, "text", "")
-                )
-            if content_type == REFUSAL_TYPE:
-                return (
-                    last_content.get("refusal", "")
-                    if isinstance(last_content, dict)
-                    else getattr(last_content, "refusal", "")
-                )
-            return ""
-        except (AttributeError, IndexError, KeyError):
+            field = CONTENT_TEXT_FIELDS.get(content_type)
+            if field is None:
+                return ""
+            return (
+                last_content.get(field, "")
+                if isinstance(last_content, dict)
+                else getattr(last_content, field, "")
+            )
+        except (AttributeError, IndexError, KeyError, TypeError):
             return ""
 
     @staticmethod
@@ -261,34 +265,19 @@ class ItemHelpers:
     @staticmethod
     def text_message_outputs(items: list[RunItem]) -> str:
         return " ".join(
-            item.text_content if isinstance(item, MessageOutputItem) else "" for item in items
-        ).strip()
+            text
+            for item in items
+            if isinstance(item, MessageOutputItem) and (text := item.text_content)
+        )
 
     @staticmethod
     def text_message_output(message: MessageOutputItem) -> str:
         try:
-            if not hasattr(message, "raw_item"):
-                return ""
-
-            raw_item = message.raw_item
-            if not isinstance(raw_item, dict):
-                return ""
-
-            content = raw_item.get("content", [])
-            if not content:
-                return ""
-
-            text_parts = []
-            for item in content:
-                if isinstance(item, dict) and item.get("type") == OUTPUT_TEXT_TYPE:
-                    text = item.get("text", "").strip()
-                    if text:
-                        text_parts.append(text)
-
-            if not text_parts:
+            # text_content is cached on the item, so the content is only walked once
+            text = getattr(message, "text_content", "")
+            if not text:
                 return ""
 
-            text = " ".join(text_parts)
             text = text.replace("', 'type': 'output_text', 'annotations': []}", "")
             text = text.replace("'text': '", "").replace("'", "").strip()
 
@@ -340,26 +329,24 @@ class ItemHelpers:
         if not content:
             return ""
         content = content.replace("', 'type': 'output_text', 'annotations': []}", "")
-        lines = [line.strip() for line in content.split("\n") if line.strip()]
+        lines = [stripped for line in content.split("\n") if (stripped := line.strip())]
         if not lines:
             return ""
 
-        # If there's only one think section, return just the content
-        if len(lines) == 1 and lines[0].startswith(THINK_START) and lines[0].endswith(THINK_END):
-            return lines[0][len(THINK_START) : -len(THINK_END)]
-
-        # If there are no special lines, just return the content as is
-        if not any(line.startswith(ItemHelpers.SPECIAL_LINES) for line in lines):
-            return " ".join(lines)
-
-        # For multiple think sections, extract content between think tags
+        # Extract content between think tags in a single pass, dropping stray tag lines
         result = []
+        has_special_lines = False
         for line in lines:
-            if line.startswith(THINK_START) and line.endswith(THINK_END):
-                result.append(line[len(THINK_START) : -len(THINK_END)])
-            elif not line.startswith(ItemHelpers.SPECIAL_LINES):
+            if line.startswith(ItemHelpers.SPECIAL_LINES):
+                has_special_lines = True
+                if line.startswith(THINK_START) and line.endswith(THINK_END):
+                    result.append(line[len(THINK_START) : -len(THINK_END)])
+            else:
                 result.append(line)
 
+        # If there are no special lines, just return the content as is
+        if not has_special_lines:
+            return " ".join(lines)
         return "\n".join(result)
 
 
@@ -288,7 +288,7 @@ class Runner:
             output_schema=output_schema,
             orbs=orbs,
         )
-        context_wrapper.usage.add(new_response.usage)
+        context_wrapper.usage = context_wrapper.usage.add(new_response.usage)
 
         processed_response = RunImpl.process_model_response(
             agent=agent,
@@ -736,6 +736,7 @@ class Runner:
                     usage=usage,
                     referenceable_id=event.response.id,
                 )
+                context_wrapper.usage = context_wrapper.usage.add(final_response.usage)
 
                 processed_response = RunImpl.process_model_response(
                     agent=agent,
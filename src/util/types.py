@@ -14,9 +14,11 @@ It includes:
 from __future__ import annotations
 
 import json
+import sys
 import time
-from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
-from dataclasses import dataclass, field
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from types import ModuleType
 from typing import Any, Generic, Literal, TypeAlias, TypedDict
 
 from typing_extensions import NotRequired, TypeVar
@@ -24,6 +26,34 @@ from typing_extensions import NotRequired, TypeVar
 from ..util.constants import err
 from ..util.exceptions import ModelError, NetworkError
 
+try:
+    import msgspec
+except ImportError:
+    _msgspec: ModuleType | None = None
+else:
+    _msgspec = msgspec
+
+try:
+    import orjson
+except ImportError:
+    _orjson: ModuleType | None = None
+else:
+    _orjson = orjson
+
+# Stream chunks are decoded with the fastest JSON parser available.
+if _msgspec is not None:
+    _json_loads: Callable[[str | bytes], Any] = _msgspec.json.Decoder().decode
+    _JSON_DECODE_ERRORS: tuple[type[Exception], ...] = (
+        json.JSONDecodeError,
+        _msgspec.DecodeError,
+    )
+elif _orjson is not None:
+    _json_loads = _orjson.loads
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+else:
+    _json_loads = json.loads
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
 ########################################################
 #              Type Variables
 ########################################################
@@ -60,6 +90,10 @@ def create_decorator_factory(
         A decorator that can be used to create instances from functions
     """
 
+    # Resolve the defaults once so each decoration only builds a single dict
+    base_params = dict(constructor_params or {})
+    func_param = next(iter(base_params), "function")
+
     def decorator(
         func: sync_func_type | async_func_type | None = None,
         **kwargs: Any,
@@ -67,14 +101,8 @@ def create_decorator_factory(
         def create_instance(
             f: sync_func_type | async_func_type,
         ) -> base_class:
-            # Start with default constructor params
-            params = dict(constructor_params or {})
-
-            # Add the function as the first parameter
-            params[next(iter(params.keys()) if params else "function")] = f
-
-            # Add any additional kwargs
-            params.update(kwargs)
+            # Defaults, then the function as the first parameter, then any kwargs
+            params = {**base_params, func_param: f, **kwargs}
 
             # Allow pre-init hook to modify params
             if pre_init_hook:
@@ -94,7 +122,7 @@ def create_decorator_factory(
 ########################################################
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Usage:
     """Track LLM API token usage and requests."""
 
@@ -119,8 +147,27 @@ class Usage:
             total_tokens=self.total_tokens + (other.total_tokens or 0),
         )
 
+    @classmethod
+    def sum(cls, usages: Iterable[Usage]) -> Usage:
+        """Sum many Usage instances, allocating only the result."""
+        requests = input_tokens = output_tokens = total_tokens = 0
+        for usage in usages:
+            requests += usage.requests or 0
+            input_tokens += usage.input_tokens or 0
+            output_tokens += usage.output_tokens or 0
+            total_tokens += usage.total_tokens or 0
+        return cls(
+            requests=requests,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=total_tokens,
+        )
+
 
-@dataclass
+_ZERO_USAGE = Usage()
+
+
+@dataclass(slots=True)
 class RunContextWrapper(Generic[TContext]):
     """Wrapper for context objects passed to Runner.run().
 
@@ -131,7 +178,7 @@ class RunContextWrapper(Generic[TContext]):
     context: TContext
     """Context object passed to Runner.run()"""
 
-    usage: Usage = field(default_factory=Usage)
+    usage: Usage = _ZERO_USAGE
     """Usage stats for the agent run. May be stale during streaming until final chunk."""
 
 
@@ -143,7 +190,7 @@ class RunContextWrapper(Generic[TContext]):
 ########################################################
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QueueCompleteSentinel:
     """Sentinel value used to indicate the end of a queue stream."""
 
@@ -153,7 +200,7 @@ class QueueCompleteSentinel:
 ########################################################
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Response:
     """API response containing outputs and usage stats."""
 
@@ -170,7 +217,7 @@ class Response:
     top_p: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelResponse:
     """Response from a model containing outputs and usage stats."""
 
@@ -254,7 +301,7 @@ class FunctionCallOutput(TypedDict):
     output: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResponseEvent:
     """Event indicating a change in response state."""
 
@@ -414,63 +461,127 @@ class ResponseFormat(TypedDict):
 #           Main class for Async Streaming
 ########################################################
 
+_DATA_PREFIX = "data: "
+_DATA_PREFIX_BYTES = b"data: "
+_DATA_PREFIX_LEN = len(_DATA_PREFIX)
+_DONE_MARKER = "[DONE]"
+_DONE_MARKER_BYTES = b"[DONE]"
+# Only identifier-like literals are interned automatically, so intern the dotted ones.
+_OBJ_CHUNK = sys.intern("chat.completion.chunk")
+_FALLBACK_ID = sys.intern("fallback-id")
+_CHUNK_TEMPLATE: dict[str, Any] = {
+    "id": "",
+    "object": _OBJ_CHUNK,
+    "created": 0,
+    "model": "",
+    "choices": None,
+}
+
+
+def _build_chunk(id: str, created: int, model: str, content: str) -> ChatCompletionChunk:
+    """Build a single-choice chunk from the shared template."""
+    chunk = _CHUNK_TEMPLATE.copy()
+    chunk["id"] = id
+    chunk["created"] = created
+    chunk["model"] = model
+    chunk["choices"] = [{"index": 0, "delta": {"content": content}}]
+    return chunk
+
 
 class AsyncStream(AsyncIterator[ChatCompletionChunk]):
     """Async iterator for streaming chat completion chunks."""
 
-    def __init__(self, stream: AsyncIterator[str | dict]):
+    def __init__(self, stream: AsyncIterator[str | bytes | dict]):
         self._stream = stream
+        self._fallback_seq: int = 0
 
     def _create_fallback_chunk(self, data: Any, content: str = "") -> ChatCompletionChunk:
         """Create a fallback chat completion chunk with default values."""
-        return {
-            "id": ("fallback-id" if not isinstance(data, dict) else data.get("id", "fallback-id")),
-            "object": "chat.completion.chunk",
-            "created": int(time.time()),
-            "model": ("unknown" if not isinstance(data, dict) else data.get("model", "unknown")),
-            "choices": [{"index": 0, "delta": {"content": content or str(data)}}],
-        }
-
-    async def __anext__(self) -> ChatCompletionChunk:
+        if type(data) is dict:
+            chunk_id, model = data.get("id", _FALLBACK_ID), data.get("model", "unknown")
+        else:
+            chunk_id, model = _FALLBACK_ID, "unknown"
+        return _build_chunk(
+            id=chunk_id,
+            created=int(time.time()),
+            model=model,
+            content=content or str(data),
+        )
+
+    def _normalize_chunk(self, data: Any) -> ChatCompletionChunk:
+        """Coerce a decoded stream payload into a chat completion chunk."""
+        # JSON objects always decode to a plain dict; anything else is not a chunk
+        if type(data) is not dict:
+            return self._create_fallback_chunk(data)
+
+        # Handle Ollama's specific response format
+        if "message" in data:
+            message = data["message"]
+            content = message.get("content", "") if type(message) is dict else str(message)
+            if "id" in data:
+                chunk_id = data["id"]
+            else:
+                chunk_id = f"ollama-{self._fallback_seq}"
+                self._fallback_seq += 1
+            return _build_chunk(
+                id=chunk_id,
+                created=data["created"] if "created" in data else int(time.time()),
+                model=data.get("model", "unknown"),
+                content=content,
+            )
+
+        # Handle incomplete response structures
+        if "choices" not in data:
+            return self._create_fallback_chunk(data)
+
+        # Ensure choices array is not empty and has delta
+        choices = data["choices"]
+        if not choices:
+            data["choices"] = [{"index": 0, "delta": {"content": ""}}]
+        elif type(choices) is not list or type(choices[0]) is not dict:
+            return self._create_fallback_chunk(data)
+        elif "delta" not in choices[0]:
+            choices[0]["delta"] = {"content": str(choices[0])}
+
+        return data
+
+    async def __anext__(
+        self,
+        *,
+        _anext: Callable[[AsyncIterator[Any]], Awaitable[Any]] = anext,
+        _loads: Callable[[str | bytes], Any] = _json_loads,
+    ) -> ChatCompletionChunk:
+        # _anext and _loads are bound as defaults so each chunk uses fast local lookups.
         try:
-            line = await anext(self._stream)
+            line = await _anext(self._stream)
+        except StopAsyncIteration:
+            raise
+        except Exception as e:
+            raise NetworkError(
+                err.NETWORK_ERROR.format(error=f"Error processing stream chunk: {e}")
+            ) from e
 
-            # If line is already a dictionary, return it directly
-            if isinstance(line, dict):
-                return line
+        # If line is already a dictionary, return it directly
+        if isinstance(line, dict):
+            return line
 
-            if line.startswith("data: "):
-                line = line[6:]
-            if line == "[DONE]":
-                raise StopAsyncIteration
+        prefix: str | bytes
+        done: str | bytes
+        if isinstance(line, bytes):
+            prefix, done = _DATA_PREFIX_BYTES, _DONE_MARKER_BYTES
+        else:
+            prefix, done = _DATA_PREFIX, _DONE_MARKER
 
-            data = json.loads(line)
-
-            # Handle Ollama's specific response format
-            if "message" in data:
-                content = data["message"].get("content", "")
-                return {
-                    "id": data.get("id", f"ollama-{hash(content)}"),
-                    "object": "chat.completion.chunk",
-                    "created": data.get("created", int(time.time())),
-                    "model": data.get("model", "unknown"),
-                    "choices": [{"index": 0, "delta": {"content": content}}],
-                }
-
-            # Handle invalid or incomplete response structures
-            if not isinstance(data, dict) or "choices" not in data:
-                return self._create_fallback_chunk(data)
-
-            # Ensure choices array is not empty and has delta
-            if not data["choices"]:
-                data["choices"] = [{"index": 0, "delta": {"content": ""}}]
-            elif "delta" not in data["choices"][0]:
-                data["choices"][0]["delta"] = {"content": str(data["choices"][0])}
-
-            return data
+        # Slicing a line that is not str or bytes raises TypeError, mapped to NetworkError
+        try:
+            if line[:_DATA_PREFIX_LEN] == prefix:
+                line = line[_DATA_PREFIX_LEN:]
+            if line == done:
+                raise StopAsyncIteration
+            data = _loads(line)
         except StopAsyncIteration:
             raise
-        except json.JSONDecodeError as e:
+        except _JSON_DECODE_ERRORS as e:
             raise ModelError(
                 err.MODEL_ERROR.format(error=f"Failed to parse JSON from stream: {e}")
             ) from e
@@ -479,6 +590,8 @@ class AsyncStream(AsyncIterator[ChatCompletionChunk]):
                 err.NETWORK_ERROR.format(error=f"Error processing stream chunk: {e}")
             ) from e
 
+        return self._normalize_chunk(data)
+
 
 class AsyncDeepSeek:
     """Async DeepSeek API client."""
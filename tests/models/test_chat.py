@@ -14,7 +14,7 @@ from src.models.chat import (
 from src.models.settings import ModelSettings
 from src.runners.items import ModelResponse
 from src.util.exceptions import AgentError, UsageError
-from src.util.types import ResponseStreamEvent
+from src.util.types import Response, ResponseStreamEvent, Usage
 
 
 @pytest.fixture
@@ -123,6 +123,42 @@ async def test_chat_model_stream_response(chat_model, model_settings, mock_sword
     assert any(chunk.type == "completed" for chunk in results)
 
 
+@pytest.mark.asyncio
+async def test_chat_model_stream_response_keeps_last_usage(chat_model, model_settings):
+    # Backends report running totals, so only the last usage snapshot counts
+    async def mock_stream():
+        yield {
+            "choices": [{"delta": {"content": "Chunk 1"}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+        }
+        yield {"choices": [{"delta": {"content": "Chunk 2"}}]}
+        yield {
+            "choices": [{"delta": {"content": ""}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        }
+
+    response = Response(id="test_id", output=[])
+    chat_model._fetch_response = AsyncMock(return_value=(response, mock_stream()))
+
+    results = [
+        event
+        async for event in chat_model.stream_response(
+            system_instructions=None,
+            input="Test input",
+            model_settings=model_settings,
+            swords=[],
+            output_schema=None,
+            orbs=[],
+        )
+    ]
+
+    completed = results[-1]
+    assert completed.type == "completed"
+    assert completed.response.usage == Usage(
+        requests=1, input_tokens=10, output_tokens=5, total_tokens=15
+    )
+
+
 def test_streaming_state():
     state = _StreamingState()
     assert state.text_content_index_and_output is None
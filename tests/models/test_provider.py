@@ -1,9 +1,14 @@
+import asyncio
+import gc
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 
 from src.models.chat import ModelChatCompletionsModel
-from src.models.provider import ModelProvider
+from src.models.provider import ModelProvider, _get_shared_httpx
 from src.models.responses import ModelResponsesModel
 from src.util.types import AsyncDeepSeek
 
@@ -111,3 +116,94 @@ def test_provider_get_model_lazy_client():
 
         assert provider._client == mock_client
         assert model._client == mock_client
+
+
+def test_provider_get_client_resolves_once():
+    # Test the shared default key is used and the client is built only once
+    provider = ModelProvider()
+
+    with (
+        patch("src.models.provider.get_default_model_key", return_value="shared-key") as mock_key,
+        patch("src.models.provider.DeepSeekClient") as mock_client_class,
+    ):
+        first = provider._get_client()
+        second = provider._get_client()
+
+        assert first is second
+        assert provider._stored_api_key == "shared-key"
+        mock_key.assert_called_once()
+        mock_client_class.assert_called_once()
+
+
+def test_provider_get_client_rebuilds_after_reset(provider):
+    # Test the client is rebuilt rather than returned as None once it is cleared
+    with patch("src.models.provider.DeepSeekClient") as mock_client_class:
+        provider._get_client()
+        provider._client = None
+
+        assert provider._get_client() is not None
+        assert mock_client_class.call_count == 2
+
+
+def test_provider_get_model_cached(provider, mock_client):
+    # Test models are reused per name and rebuilt when the API mode changes
+    provider._client = mock_client
+    model = provider.get_model("test-model")
+
+    assert provider.get_model("test-model") is model
+    assert provider.get_model("other-model") is not model
+
+    provider.use_responses = True
+    assert isinstance(provider.get_model("test-model"), ModelResponsesModel)
+
+
+def test_providers_share_http_client():
+    # Test separate providers on the same event loop reuse the same HTTP client
+    async def build_clients():
+        with patch("src.models.provider.DeepSeekClient") as mock_client_class:
+            ModelProvider(api_key="key-1")._get_client()
+            ModelProvider(api_key="key-2")._get_client()
+            return [call.kwargs["http_client"] for call in mock_client_class.call_args_list]
+
+    first, second = asyncio.run(build_clients())
+    assert first is second
+
+
+def test_shared_http_client_per_event_loop():
+    # Test each asyncio.run gets its own client and the previous loop is released,
+    # even though its client still holds a pooled keep-alive connection
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    async def fetch():
+        client = _get_shared_httpx()
+        await client.get(url)
+        return weakref.ref(asyncio.get_running_loop()), client
+
+    try:
+        first_loop, first = asyncio.run(fetch())
+        second_loop, second = asyncio.run(fetch())
+        assert first is not second
+
+        del first
+        gc.collect()
+
+        assert first_loop() is None
+        assert second_loop() is not None
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert _get_shared_httpx() is not _get_shared_httpx()
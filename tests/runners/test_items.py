@@ -1,4 +1,11 @@
+# Tests here share no state beyond module-scoped, read-only fixtures, so they are safe to
+# run in parallel.
+
+import json
 from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
 
 from src.runners.items import (
     THINK_END,
@@ -21,46 +28,37 @@ from src.util.types import (
     Usage,
 )
 
+# Read-only payloads shared across tests, loaded once from tests/fixtures;
+# tuple content signals they are never mutated
+_RESPONSE_OUTPUTS = {
+    name: ResponseOutput(type=output["type"], content=tuple(output["content"]))
+    for name, output in json.loads(
+        (Path(__file__).parent.parent / "fixtures" / "response_outputs.json").read_bytes()
+    ).items()
+}
+_EMPTY_OUTPUT = _RESPONSE_OUTPUTS["empty"]
+_HELLO_OUTPUT = _RESPONSE_OUTPUTS["hello"]
+_WORLD_OUTPUT = _RESPONSE_OUTPUTS["world"]
+_HELLO_WORLD_OUTPUT = _RESPONSE_OUTPUTS["hello_world"]
+_REFUSAL_OUTPUT = _RESPONSE_OUTPUTS["refusal"]
+_THINK_SINGLE = f"{THINK_START}Thinking{THINK_END}"
+_THINK_DOUBLE = f"{THINK_START}First thought{THINK_END}\n{THINK_START}Second thought{THINK_END}"
+
 
 # Mock Agent class for testing
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockAgent:
     name: str
 
 
-def test_message_output_item_text_content():
-    """Test MessageOutputItem text content extraction."""
-    # Create a mock agent
-    agent = MockAgent(name="test_agent")
-
-    # Test case 1: Empty content
-    empty_output = ResponseOutput(type="message", content=[])
-    item = MessageOutputItem(agent=agent, raw_item=empty_output)
-    assert item.text_content == ""
-
-    # Test case 2: Single text content
-    text_output = ResponseOutput(
-        type="message", content=[{"type": "output_text", "text": "Hello world"}]
-    )
-    item = MessageOutputItem(agent=agent, raw_item=text_output)
-    assert item.text_content == "Hello world"
-
-    # Test case 3: Multiple text contents
-    multi_output = ResponseOutput(
-        type="message",
-        content=[
-            {"type": "output_text", "text": "Hello"},
-            {"type": "output_text", "text": "world"},
-        ],
-    )
-    item = MessageOutputItem(agent=agent, raw_item=multi_output)
-    assert item.text_content == "Hello world"
+@pytest.fixture(scope="module")
+def agent():
+    return MockAgent(name="test_agent")
 
 
-def test_orbs_call_item():
-    """Test OrbsCallItem creation and attributes."""
-    agent = MockAgent(name="test_agent")
-    sword_call = ResponseFunctionSwordCall(
+@pytest.fixture(scope="module")
+def sword_call():
+    return ResponseFunctionSwordCall(
         type="function_call",
         id="test_id",
         call_id="test_call_id",
@@ -68,49 +66,105 @@ def test_orbs_call_item():
         arguments="{}",
     )
 
-    item = OrbsCallItem(agent=agent, raw_item=sword_call)
-    assert item.type == "orbs_call_item"
-    assert item.raw_item == sword_call
 
-
-def test_sword_call_item():
-    """Test SwordCallItem creation and attributes."""
-    agent = MockAgent(name="test_agent")
-    sword_call = ResponseFunctionSwordCall(
-        type="function_call",
-        id="test_id",
-        call_id="test_call_id",
-        name="test_function",
-        arguments="{}",
+@pytest.fixture(scope="module")
+def function_output():
+    return FunctionCallOutput(
+        type="function_call_output", call_id="test_call_id", output="test output"
     )
 
-    item = SwordCallItem(agent=agent, raw_item=sword_call)
-    assert item.type == "sword_called"
-    assert item.raw_item == sword_call
 
+@pytest.fixture(scope="module")
+def usage():
+    return Usage(requests=1, input_tokens=10, output_tokens=5, total_tokens=15)
 
-def test_sword_call_output_item():
-    """Test SwordCallOutputItem creation and attributes."""
-    agent = MockAgent(name="test_agent")
-    function_output = FunctionCallOutput(
-        type="function_call_output", call_id="test_call_id", output="test output"
+
+def test_response_output_fixtures_match_literals():
+    """Test the JSON fixture payloads decode to the same shape as hand-built literals."""
+    assert {**_HELLO_OUTPUT, "content": list(_HELLO_OUTPUT["content"])} == ResponseOutput(
+        type="message", content=[{"type": "output_text", "text": "Hello"}]
+    )
+    assert {**_REFUSAL_OUTPUT, "content": list(_REFUSAL_OUTPUT["content"])} == ResponseOutput(
+        type="message", content=[{"type": "refusal", "refusal": "I cannot do that"}]
     )
 
-    item = SwordCallOutputItem(agent=agent, raw_item=function_output, output="test output")
-    assert item.type == "sword_call_output_item"
-    assert item.raw_item == function_output
-    assert item.output == "test output"
 
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        pytest.param([], "", id="empty", marks=pytest.mark.fast),
+        pytest.param([{"type": "output_text", "text": "Hello world"}], "Hello world", id="single"),
+        pytest.param(
+            [
+                {"type": "output_text", "text": "Hello"},
+                {"type": "output_text", "text": "world"},
+            ],
+            "Hello world",
+            id="multiple",
+        ),
+        pytest.param(
+            [{"type": "output_text", "text": "x" * 10_000}],
+            "x" * 10_000,
+            id="huge",
+            marks=pytest.mark.slow,
+        ),
+    ],
+)
+def test_message_output_item_text_content(agent, content, expected):
+    """Test MessageOutputItem text content extraction."""
+    item = MessageOutputItem(agent=agent, raw_item=ResponseOutput(type="message", content=content))
+    assert item.text_content == expected
+
+
+def test_message_output_item_text_content_mixed_items(agent):
+    """Test MessageOutputItem.text_content reads dict and attribute-style content alike."""
+
+    @dataclass(slots=True, frozen=True)
+    class TextPart:
+        type: str
+        text: str
+
+    content = [
+        {"type": "output_text", "text": " Hello "},
+        {"type": "refusal", "refusal": "no"},
+        TextPart(type="output_text", text="World"),
+        TextPart(type="output_text", text="   "),
+    ]
+    item = MessageOutputItem(agent=agent, raw_item=ResponseOutput(type="message", content=content))
+    assert item.text_content == "Hello World"
+
+
+@pytest.mark.parametrize(
+    "item_cls,raw_fixture,extra,expected_type",
+    [
+        pytest.param(OrbsCallItem, "sword_call", {}, "orbs_call_item", id="orbs_call"),
+        pytest.param(SwordCallItem, "sword_call", {}, "sword_called", id="sword_call"),
+        pytest.param(
+            SwordCallOutputItem,
+            "function_output",
+            {"output": "test output"},
+            "sword_call_output_item",
+            id="sword_call_output",
+        ),
+    ],
+)
+def test_call_items(request, agent, item_cls, raw_fixture, extra, expected_type):
+    """Test OrbsCallItem, SwordCallItem and SwordCallOutputItem creation and attributes."""
+    raw_item = request.getfixturevalue(raw_fixture)
+
+    item = item_cls(agent=agent, raw_item=raw_item, **extra)
+    assert item.type == expected_type
+    assert item.raw_item is raw_item
+    for name, value in extra.items():
+        assert getattr(item, name) == value
 
-def test_model_response():
-    """Test ModelResponse creation and methods."""
-    output = [ResponseOutput(type="message", content=[{"type": "output_text", "text": "Hello"}])]
-    usage = Usage(requests=1, input_tokens=10, output_tokens=5, total_tokens=15)
 
-    response = ModelResponse(output=output, usage=usage, referenceable_id="test_id")
+def test_model_response(usage):
+    """Test ModelResponse creation and methods."""
+    response = ModelResponse(output=[_HELLO_OUTPUT], usage=usage, referenceable_id="test_id")
 
     assert len(response.output) == 1
-    assert response.usage == usage
+    assert response.usage is usage
     assert response.referenceable_id == "test_id"
 
     input_items = response.to_input_items()
@@ -118,52 +172,74 @@ def test_model_response():
     assert isinstance(input_items[0], dict)
 
 
-def test_item_helpers_extract_last_content():
-    """Test ItemHelpers.extract_last_content method."""
-    # Test case 1: Empty message
-    empty_message = ResponseOutput(type="message", content=[])
-    assert ItemHelpers.extract_last_content(empty_message) == ""
+def test_model_response_to_input_items_is_cached(usage):
+    """Test ModelResponse.to_input_items converts once and reuses the list on repeat calls."""
+    response = ModelResponse(output=[_HELLO_OUTPUT], usage=usage, referenceable_id=None)
 
-    # Test case 2: Text content
-    text_message = ResponseOutput(
-        type="message", content=[{"type": "output_text", "text": "Hello"}]
-    )
-    assert ItemHelpers.extract_last_content(text_message) == "Hello"
+    first = response.to_input_items()
+    assert response.to_input_items() is first
+    assert first == [_HELLO_OUTPUT]
 
-    # Test case 3: Refusal content
-    refusal_message = ResponseOutput(
-        type="message", content=[{"type": "refusal", "refusal": "I cannot do that"}]
+
+def test_model_response_dumps_pydantic_outputs(agent, usage):
+    """Test input item conversion keeps dicts and dumps pydantic outputs."""
+    from pydantic import BaseModel
+
+    class PydanticOutput(BaseModel):
+        type: str
+        content: str | None = None
+
+    response = ModelResponse(
+        output=[_HELLO_OUTPUT, PydanticOutput(type="message")],
+        usage=usage,
+        referenceable_id=None,
     )
-    assert ItemHelpers.extract_last_content(refusal_message) == "I cannot do that"
+
+    input_items = response.to_input_items()
+    assert input_items[0] is _HELLO_OUTPUT
+    assert input_items[1] == {"type": "message"}
+
+    item = ReasoningItem(agent=agent, raw_item=PydanticOutput(type="reasoning"))
+    assert item.input_item == {"type": "reasoning"}
+
+
+@pytest.mark.parametrize(
+    "message,expected",
+    [
+        pytest.param(_EMPTY_OUTPUT, "", id="empty", marks=pytest.mark.fast),
+        pytest.param(_HELLO_OUTPUT, "Hello", id="text"),
+        pytest.param(_REFUSAL_OUTPUT, "I cannot do that", id="refusal"),
+    ],
+)
+def test_item_helpers_extract_last_content(message, expected):
+    """Test ItemHelpers.extract_last_content method."""
+    assert ItemHelpers.extract_last_content(message) == expected
 
 
 def test_item_helpers_input_to_new_input_list():
     """Test ItemHelpers.input_to_new_input_list method."""
-    # Test case 1: String input
-    string_input = "Hello"
-    result = ItemHelpers.input_to_new_input_list(string_input)
+    result = ItemHelpers.input_to_new_input_list("Hello")
     assert len(result) == 1
     assert result[0]["content"] == "Hello"
     assert result[0]["role"] == "user"
 
-    # Test case 2: List input
-    list_input = [ResponseInputItemParam(type="message", content="Hello", role="user")]
+
+@pytest.mark.parametrize("n", [1, 10, 100])
+def test_item_helpers_input_to_new_input_list_from_list(n):
+    """Test ItemHelpers.input_to_new_input_list copies list input of any length."""
+    list_input = [
+        ResponseInputItemParam(type="message", content=f"msg {i}", role="user") for i in range(n)
+    ]
+
     result = ItemHelpers.input_to_new_input_list(list_input)
-    assert len(result) == 1
-    assert result[0]["content"] == "Hello"
+    assert result == list_input
+    assert result is not list_input
+    assert result[-1]["content"] == f"msg {n - 1}"
     assert result[0]["role"] == "user"
 
 
-def test_item_helpers_sword_call_output_item():
+def test_item_helpers_sword_call_output_item(sword_call):
     """Test ItemHelpers.sword_call_output_item method."""
-    sword_call = ResponseFunctionSwordCall(
-        type="function_call",
-        id="test_id",
-        call_id="test_call_id",
-        name="test_function",
-        arguments="{}",
-    )
-
     output = "test output"
     result = ItemHelpers.sword_call_output_item(sword_call, output)
 
@@ -185,105 +261,102 @@ def test_orbs_output_item():
         target_agent=target_agent,
     )
     assert item.type == "orbs_output_item"
-    assert item.raw_item == input_param
-    assert item.source_agent == source_agent
-    assert item.target_agent == target_agent
+    assert item.raw_item is input_param
+    assert item.source_agent is source_agent
+    assert item.target_agent is target_agent
 
 
-def test_reasoning_item():
+def test_reasoning_item(agent):
     """Test ReasoningItem creation and attributes."""
-    agent = MockAgent(name="test_agent")
     reasoning_item = ResponseReasoningItem(
         type="reasoning", content="test reasoning content", step=1
     )
 
     item = ReasoningItem(agent=agent, raw_item=reasoning_item)
     assert item.type == "reasoning_item"
-    assert item.raw_item == reasoning_item
+    assert item.raw_item is reasoning_item
 
 
-def test_item_helpers_extract_last_text():
+@pytest.mark.parametrize(
+    "message,expected",
+    [
+        pytest.param(_EMPTY_OUTPUT, None, id="empty", marks=pytest.mark.fast),
+        pytest.param(_HELLO_OUTPUT, "Hello", id="text"),
+        pytest.param(_REFUSAL_OUTPUT, None, id="non_text"),
+    ],
+)
+def test_item_helpers_extract_last_text(message, expected):
     """Test ItemHelpers.extract_last_text method."""
-    # Test case 1: Empty message
-    empty_message = ResponseOutput(type="message", content=[])
-    assert ItemHelpers.extract_last_text(empty_message) is None
-
-    # Test case 2: Text content
-    text_message = ResponseOutput(
-        type="message", content=[{"type": "output_text", "text": "Hello"}]
-    )
-    assert ItemHelpers.extract_last_text(text_message) == "Hello"
-
-    # Test case 3: Non-text content
-    refusal_message = ResponseOutput(
-        type="message", content=[{"type": "refusal", "refusal": "I cannot do that"}]
-    )
-    assert ItemHelpers.extract_last_text(refusal_message) is None
+    assert ItemHelpers.extract_last_text(message) == expected
 
 
-def test_item_helpers_text_message_outputs():
+def test_item_helpers_text_message_outputs(agent):
     """Test ItemHelpers.text_message_outputs method."""
-    agent = MockAgent(name="test_agent")
-
     # Test case 1: Empty list
     assert ItemHelpers.text_message_outputs([]) == ""
 
     # Test case 2: Single message
-    message_item = MessageOutputItem(
-        agent=agent,
-        raw_item=ResponseOutput(type="message", content=[{"type": "output_text", "text": "Hello"}]),
-    )
+    message_item = MessageOutputItem(agent=agent, raw_item=_HELLO_OUTPUT)
     assert ItemHelpers.text_message_outputs([message_item]) == "Hello"
 
     # Test case 3: Multiple messages
-    message_item2 = MessageOutputItem(
-        agent=agent,
-        raw_item=ResponseOutput(type="message", content=[{"type": "output_text", "text": "World"}]),
-    )
+    message_item2 = MessageOutputItem(agent=agent, raw_item=_WORLD_OUTPUT)
     assert ItemHelpers.text_message_outputs([message_item, message_item2]) == "Hello World"
 
 
-def test_item_helpers_text_message_output():
-    """Test ItemHelpers.text_message_output method."""
-    agent = MockAgent(name="test_agent")
+@pytest.mark.parametrize("n", [0, 1, 10, 100])
+def test_item_helpers_text_message_outputs_many(agent, sword_call, n):
+    """Test ItemHelpers.text_message_outputs joins long transcripts and skips other items."""
+    items = []
+    for _ in range(n):
+        items.append(MessageOutputItem(agent=agent, raw_item=_HELLO_OUTPUT))
+        items.append(SwordCallItem(agent=agent, raw_item=sword_call))
 
-    # Test case 1: Empty content
-    empty_item = MessageOutputItem(agent=agent, raw_item=ResponseOutput(type="message", content=[]))
-    assert ItemHelpers.text_message_output(empty_item) == ""
+    assert ItemHelpers.text_message_outputs(items) == " ".join(["Hello"] * n)
 
-    # Test case 2: Single text content
-    text_item = MessageOutputItem(
-        agent=agent,
-        raw_item=ResponseOutput(type="message", content=[{"type": "output_text", "text": "Hello"}]),
-    )
-    assert ItemHelpers.text_message_output(text_item) == "Hello"
-
-    # Test case 3: Multiple text contents
-    multi_item = MessageOutputItem(
-        agent=agent,
-        raw_item=ResponseOutput(
-            type="message",
-            content=[
-                {"type": "output_text", "text": "Hello"},
-                {"type": "output_text", "text": "World"},
-            ],
-        ),
-    )
-    assert ItemHelpers.text_message_output(multi_item) == "Hello World"
 
+@pytest.mark.parametrize(
+    "raw_item,expected",
+    [
+        pytest.param(_EMPTY_OUTPUT, "", id="empty", marks=pytest.mark.fast),
+        pytest.param(_HELLO_OUTPUT, "Hello", id="single"),
+        pytest.param(_HELLO_WORLD_OUTPUT, "Hello World", id="multiple"),
+    ],
+)
+def test_item_helpers_text_message_output(agent, raw_item, expected):
+    """Test ItemHelpers.text_message_output method."""
+    item = MessageOutputItem(agent=agent, raw_item=raw_item)
+    assert ItemHelpers.text_message_output(item) == expected
 
-def test_item_helpers_format_content():
-    """Test ItemHelpers.format_content method."""
-    # Test case 1: Empty content
-    assert ItemHelpers.format_content("") == ""
 
-    # Test case 2: Simple content
-    assert ItemHelpers.format_content("Hello") == "Hello"
+def test_item_helpers_text_message_output_reuses_text_content(agent):
+    """Test ItemHelpers.text_message_output reads the cached MessageOutputItem.text_content."""
+    item = MessageOutputItem(agent=agent, raw_item=_HELLO_WORLD_OUTPUT)
 
-    # Test case 3: Content with special lines
-    content = f"{THINK_START}Thinking{THINK_END}"
-    assert ItemHelpers.format_content(content) == "Thinking"
+    assert ItemHelpers.text_message_output(item) == "Hello World"
+    assert item.__dict__["text_content"] == "Hello World"
 
-    # Test case 4: Content with multiple sections
-    content = f"{THINK_START}First thought{THINK_END}\n{THINK_START}Second thought{THINK_END}"
-    assert ItemHelpers.format_content(content) == "First thought\nSecond thought"
+
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        pytest.param("", "", id="empty", marks=pytest.mark.fast),
+        pytest.param("Hello", "Hello", id="simple"),
+        pytest.param(_THINK_SINGLE, "Thinking", id="special_lines"),
+        pytest.param(_THINK_DOUBLE, "First thought\nSecond thought", id="multiple_sections"),
+        pytest.param(
+            f"{THINK_START}Plan{THINK_END}\nAnswer\n{THINK_END}",
+            "Plan\nAnswer",
+            id="mixed_lines",
+        ),
+        pytest.param(
+            "\n".join(f"{THINK_START}thought {i}{THINK_END}" for i in range(1000)),
+            "\n".join(f"thought {i}" for i in range(1000)),
+            id="many_sections",
+            marks=pytest.mark.slow,
+        ),
+    ],
+)
+def test_item_helpers_format_content(content, expected):
+    """Test ItemHelpers.format_content method."""
+    assert ItemHelpers.format_content(content) == expected
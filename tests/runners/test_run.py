@@ -29,7 +29,7 @@ from src.runners.run_impl import (
     SingleStepResult,
 )
 from src.util.exceptions import MaxTurnsError, RunnerError
-from src.util.types import ResponseEvent, Usage
+from src.util.types import Response, ResponseEvent, Usage
 
 
 # Test fixtures
@@ -614,6 +614,83 @@ async def test_run_turn(
         assert result.next_step.output == "test output"
 
 
+@pytest.mark.asyncio
+async def test_execute_turn_accumulates_usage(
+    mock_agent, mock_model, mock_run_config, context_wrapper, mock_charms
+):
+    """Test each turn's model usage is added to the run context."""
+    with (
+        patch("src.runners.run.RunImpl.process_model_response"),
+        patch("src.runners.run.RunImpl.execute_swords_and_side_effects", new_callable=AsyncMock),
+    ):
+        for turn in (1, 2):
+            await Runner._execute_turn(
+                agent=mock_agent,
+                original_input="test input",
+                generated_items=[],
+                charms=mock_charms,
+                context_wrapper=context_wrapper,
+                run_config=mock_run_config,
+                should_run_agent_start_charms=False,
+                current_turn=turn,
+            )
+
+    assert mock_model.get_response.await_count == 2
+    assert context_wrapper.usage == Usage(
+        requests=2, input_tokens=20, output_tokens=10, total_tokens=30
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_single_turn_streamed_accumulates_usage(
+    mock_agent, mock_model, mock_run_config, context_wrapper, mock_charms
+):
+    """Test each streamed turn's final usage is added to the run context."""
+
+    async def stream_response(*args, **kwargs):
+        yield ResponseEvent(
+            type="completed",
+            response=Response(
+                id="test_id",
+                output=[],
+                usage=Usage(requests=1, input_tokens=10, output_tokens=5, total_tokens=15),
+            ),
+        )
+
+    mock_model.stream_response = stream_response
+    streamed_result = RunResultStreaming(
+        input="test input",
+        new_items=[],
+        current_agent=mock_agent,
+        raw_responses=[],
+        final_output=None,
+        is_complete=False,
+        current_turn=0,
+        max_turns=10,
+        input_shield_results=[],
+        output_shield_results=[],
+    )
+
+    with (
+        patch("src.runners.run.RunImpl.process_model_response"),
+        patch("src.runners.run.RunImpl.execute_swords_and_side_effects", new_callable=AsyncMock),
+        patch("src.runners.run.RunImpl.stream_step_result_to_queue"),
+    ):
+        for _ in range(2):
+            await Runner._run_single_turn_streamed(
+                streamed_result=streamed_result,
+                agent=mock_agent,
+                charms=mock_charms,
+                context_wrapper=context_wrapper,
+                run_config=mock_run_config,
+                should_run_agent_start_charms=False,
+            )
+
+    assert context_wrapper.usage == Usage(
+        requests=2, input_tokens=20, output_tokens=10, total_tokens=30
+    )
+
+
 @pytest.mark.asyncio
 async def test_run_with_input_shield_error(mock_agent):
     # Setup
@@ -1,8 +1,12 @@
+import json
 from collections.abc import Sequence
+from dataclasses import FrozenInstanceError, dataclass
 from datetime import datetime
+from typing import Any
 
 import pytest
 
+from src.util.exceptions import ModelError, NetworkError
 from src.util.types import (
     AsyncStream,
     ChatCompletionMessage,
@@ -14,10 +18,31 @@ from src.util.types import (
     ResponseOutput,
     ResponseOutputRefusal,
     ResponseOutputText,
+    RunContextWrapper,
     Usage,
+    create_decorator_factory,
 )
 
 
+def test_create_decorator_factory():
+    """Test the decorated function fills the first constructor parameter."""
+
+    @dataclass
+    class Wrapper:
+        handler: Any = None
+        name: str | None = None
+
+    decorator = create_decorator_factory(
+        Wrapper, type, type, constructor_params={"handler": None, "name": "default"}
+    )
+
+    def handler():
+        pass
+
+    assert decorator(handler) == Wrapper(handler=handler, name="default")
+    assert decorator(name="custom")(handler) == Wrapper(handler=handler, name="custom")
+
+
 def test_usage_add():
     """Test Usage class addition functionality."""
     usage1 = Usage(requests=1, input_tokens=10, output_tokens=5, total_tokens=15)
@@ -31,6 +56,65 @@ def test_usage_add():
     assert result.total_tokens == 45
 
 
+def test_usage_sum():
+    """Test Usage.sum matches chained additions."""
+    usages = [
+        Usage(requests=1, input_tokens=i, output_tokens=i, total_tokens=2 * i) for i in range(5)
+    ]
+
+    assert Usage.sum(usages) == Usage(
+        requests=5, input_tokens=10, output_tokens=10, total_tokens=20
+    )
+    assert Usage.sum([]) == Usage()
+
+
+def test_usage_is_slotted():
+    """Test Usage instances do not carry a per-instance __dict__."""
+    usage = Usage(requests=1)
+
+    assert not hasattr(usage, "__dict__")
+    assert Usage.__slots__ == (
+        "requests",
+        "input_tokens",
+        "output_tokens",
+        "total_tokens",
+    )
+
+
+def test_usage_is_immutable():
+    """Test Usage rejects re-assignment and hashes by value."""
+    usage = Usage(requests=1, input_tokens=10, output_tokens=5, total_tokens=15)
+
+    with pytest.raises(FrozenInstanceError):
+        usage.requests = 2
+
+    assert hash(usage) == hash(Usage(requests=1, input_tokens=10, output_tokens=5, total_tokens=15))
+
+
+def test_run_context_wrapper_is_slotted():
+    """Test RunContextWrapper keeps context and usage in slots."""
+    wrapper = RunContextWrapper(context={"key": "value"})
+
+    assert not hasattr(wrapper, "__dict__")
+    assert wrapper.usage == Usage()
+
+    wrapper.usage = wrapper.usage.add(Usage(requests=1))
+    assert wrapper.usage.requests == 1
+
+
+def test_run_context_wrapper_shares_immutable_zero_usage():
+    """Test RunContextWrapper defaults to one shared zero Usage that cannot be mutated."""
+    first = RunContextWrapper(context=None)
+    second = RunContextWrapper(context=None)
+
+    assert first.usage is second.usage
+    with pytest.raises(FrozenInstanceError):
+        first.usage.requests += 1
+
+    first.usage = first.usage.add(Usage(requests=1))
+    assert second.usage == RunContextWrapper(context=None).usage == Usage()
+
+
 def test_response_creation():
     """Test Response class creation and attributes."""
     output = ResponseOutput(type="test", content="test content", name="test_name")
@@ -139,3 +223,144 @@ async def test_async_stream():
     assert chunk["created"] == 123
     assert chunk["model"] == "test"
     assert isinstance(chunk["choices"], Sequence)
+
+
+@pytest.mark.asyncio
+async def test_async_stream_parses_sse_bytes():
+    """Test AsyncStream strips the SSE prefix from bytes lines and stops on [DONE]."""
+
+    async def mock_stream():
+        yield b'data: {"id": "test", "choices": [{"index": 0, "delta": {"content": "hi"}}]}'
+        yield b"data: [DONE]"
+
+    stream = AsyncStream(mock_stream())
+    chunk = await stream.__anext__()
+
+    assert chunk["id"] == "test"
+    assert chunk["choices"][0]["delta"]["content"] == "hi"
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_async_stream_invalid_json_raises_model_error():
+    """Test AsyncStream maps JSON decode failures to ModelError."""
+
+    async def mock_stream():
+        yield "data: {not json"
+
+    stream = AsyncStream(mock_stream())
+
+    with pytest.raises(ModelError):
+        await stream.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_async_stream_fallback_chunks_are_independent():
+    """Test fallback chunks built from the shared template do not alias each other."""
+
+    async def mock_stream():
+        yield '{"message": {"content": "first"}, "id": "a", "model": "m", "created": 1}'
+        yield '{"unexpected": true}'
+
+    stream = AsyncStream(mock_stream())
+    first = await stream.__anext__()
+    second = await stream.__anext__()
+
+    assert first["id"] == "a"
+    assert first["model"] == "m"
+    assert first["object"] == second["object"] == "chat.completion.chunk"
+    assert first["choices"][0]["delta"]["content"] == "first"
+    assert second["id"] == "fallback-id"
+    assert second["choices"] is not first["choices"]
+
+
+@pytest.mark.asyncio
+async def test_async_stream_ollama_fallback_ids_are_sequential():
+    """Test Ollama chunks without an id get a per-stream sequence id."""
+
+    async def mock_stream():
+        yield '{"message": {"content": "same"}}'
+        yield '{"message": {"content": "same"}}'
+
+    stream = AsyncStream(mock_stream())
+
+    assert (await stream.__anext__())["id"] == "ollama-0"
+    assert (await stream.__anext__())["id"] == "ollama-1"
+
+
+@pytest.mark.asyncio
+async def test_async_stream_non_object_json_falls_back():
+    """Test non-object JSON payloads become fallback chunks."""
+
+    async def mock_stream():
+        yield '"message"'
+
+    stream = AsyncStream(mock_stream())
+    chunk = await stream.__anext__()
+
+    assert chunk["id"] == "fallback-id"
+    assert chunk["model"] == "unknown"
+    assert chunk["choices"][0]["delta"]["content"] == "message"
+
+
+@pytest.mark.asyncio
+async def test_async_stream_source_failure_raises_network_error():
+    """Test failures from the underlying stream are wrapped in NetworkError."""
+
+    async def mock_stream():
+        raise RuntimeError("connection reset")
+        yield  # pragma: no cover
+
+    stream = AsyncStream(mock_stream())
+
+    with pytest.raises(NetworkError):
+        await stream.__anext__()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("decoder", ["json", "msgspec", "orjson"])
+async def test_async_stream_nan_depends_on_decoder(decoder):
+    """Test stdlib json turns a bare NaN into a fallback chunk while the fast decoders reject it."""
+
+    async def mock_stream():
+        yield "data: NaN"
+
+    stream = AsyncStream(mock_stream())
+
+    if decoder == "json":
+        chunk = await stream.__anext__(_loads=json.loads)
+        assert chunk["choices"][0]["delta"]["content"] == "nan"
+        return
+
+    module = pytest.importorskip(decoder)
+    loads = module.json.Decoder().decode if decoder == "msgspec" else module.loads
+    with pytest.raises(ModelError):
+        await stream.__anext__(_loads=loads)
+
+
+@pytest.mark.asyncio
+async def test_async_stream_unsupported_line_raises_network_error():
+    """Test stream items that are not str, bytes or dict are wrapped in NetworkError."""
+
+    async def mock_stream():
+        yield None
+
+    stream = AsyncStream(mock_stream())
+
+    with pytest.raises(NetworkError):
+        await stream.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_async_stream_malformed_payloads_fall_back():
+    """Test malformed message and choices payloads become fallback chunks."""
+
+    async def mock_stream():
+        yield '{"message": "plain text"}'
+        yield '{"choices": ["not a dict"]}'
+
+    stream = AsyncStream(mock_stream())
+
+    assert (await stream.__anext__())["choices"][0]["delta"]["content"] == "plain text"
+    assert (await stream.__anext__())["id"] == "fallback-id"